@@ -17,10 +17,10 @@ from plotly.subplots import make_subplots
 import numpy as np
 from datetime import datetime, timedelta, date
 from wordcloud import WordCloud
-import matplotlib.pyplot as plt
 import io
-import base64
 import os
+import hashlib
+import importlib.util
 
 # Import our custom modules
 from nlp_utils import analyze_journal_entries, get_mood_statistics, get_common_keywords
@@ -68,6 +68,169 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+# Maximum number of points drawn on the mood timeline before it is downsampled
+TIMELINE_MAX_POINTS = 1500
+
+# Color for each mood, in the same order as MOOD_CATEGORIES
+MOOD_COLORS = ['#d62728', '#ff7f0e', '#7f7f7f', '#2ca02c', '#1f77b4']
+
+# pyarrow is optional; without it pandas falls back to its C parser
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+CSV_ENGINE = 'pyarrow' if HAS_PYARROW else 'c'
+
+# Arrow-backed strings keep long journal text compact (UTF-8) when pyarrow is available
+TEXT_DTYPE = 'string[pyarrow]' if HAS_PYARROW else 'string'
+
+# Keywords as one Arrow list<string> column instead of a Python list per entry
+if HAS_PYARROW:
+    import pyarrow as pa
+    KEYWORDS_DTYPE = pd.ArrowDtype(pa.list_(pa.string()))
+else:
+    KEYWORDS_DTYPE = object
+
+# Processed copies of on-disk CSV files, so cold starts can skip the NLP pipeline.
+# Bump the version whenever the processed columns change so old copies are ignored.
+PARQUET_CACHE_DIR = 'data/.cache'
+PARQUET_CACHE_VERSION = 3
+
+
+def _parquet_cache_path(src_path):
+    """
+    Path of the Parquet sidecar for a CSV file.
+    
+    The name includes the file's modification time and size, so editing or
+    re-converting the CSV automatically points at a new cache file.
+    """
+    stat = os.stat(src_path)
+    stem = os.path.splitext(os.path.basename(src_path))[0]
+    key = f"v{PARQUET_CACHE_VERSION}-{stat.st_mtime_ns}-{stat.st_size}"
+    return os.path.join(PARQUET_CACHE_DIR, f"{stem}_{key}.parquet")
+
+
+def _write_parquet_cache(processed_df, cache_path):
+    """Save processed entries to a Parquet sidecar, replacing older versions."""
+    try:
+        os.makedirs(PARQUET_CACHE_DIR, exist_ok=True)
+        
+        # The key part of the name has no underscores, so this recovers the source name
+        stem = os.path.basename(cache_path).rsplit('_', 1)[0]
+        for name in os.listdir(PARQUET_CACHE_DIR):
+            if name.endswith('.parquet') and name.rsplit('_', 1)[0] == stem:
+                os.remove(os.path.join(PARQUET_CACHE_DIR, name))
+        
+        processed_df.to_parquet(cache_path, compression='zstd')
+    except Exception:
+        # The cache is only a speed-up; the entries get reprocessed next time
+        pass
+
+
+@st.cache_resource
+def get_db():
+    """
+    Shared database connection, opened once and reused across reruns.
+    JournalDatabase serializes access to it, so every session can use it.
+    
+    Returns:
+        JournalDatabase: Database handle managed by Streamlit's resource cache
+    """
+    return JournalDatabase()
+
+
+@st.cache_data(show_spinner=False)
+def _load_processed(_file_bytes, file_digest, src_path, mtime):
+    """
+    Read a journal CSV and run sentiment analysis on it.
+    
+    The result is cached by Streamlit, keyed on a digest of the uploaded bytes
+    or the on-disk path plus its modification time, so widget interactions reuse the
+    processed entries instead of re-running the NLP pipeline on every rerun.
+    On-disk files are also kept as Parquet sidecars so a fresh server start
+    can skip the NLP pipeline while the CSV is unchanged.
+    
+    Args:
+        _file_bytes (bytes): Contents of an uploaded file, or None (not hashed by Streamlit)
+        file_digest (str): Digest of _file_bytes, used as its cache key
+        src_path (str): Path of an on-disk CSV file, or None
+        mtime (float): Modification time of src_path, used only as a cache key
+        
+    Returns:
+        pd.DataFrame: Processed journal entries with sentiment analysis
+    """
+    # Reuse the processed copy of an unchanged on-disk file
+    cache_path = _parquet_cache_path(src_path) if src_path is not None and HAS_PYARROW else None
+    if cache_path is not None and os.path.exists(cache_path):
+        processed_df = pd.read_parquet(cache_path)
+        processed_df['keywords'] = processed_df['keywords'].astype(KEYWORDS_DTYPE)
+        return processed_df
+    
+    source = io.BytesIO(_file_bytes) if _file_bytes is not None else src_path
+    
+    # Read only the columns we use, with their final types, in a single parse
+    df = pd.read_csv(
+        source,
+        usecols=['date', 'title', 'content'],
+        parse_dates=['date'],
+        dtype={'title': TEXT_DTYPE, 'content': TEXT_DTYPE},
+        engine=CSV_ENGINE
+    )
+    processed_df = analyze_journal_entries(df)
+    
+    # Entries with a blank or unreadable date can't be placed on any chart, so
+    # drop them here (the date filter used to hide them); the sidebar shows how many
+    undated_count = int(processed_df['date'].isna().sum())
+    if undated_count:
+        processed_df = processed_df.dropna(subset=['date'])
+    processed_df.attrs['undated_entries'] = undated_count
+    
+    # Day of week (Monday=0) as a compact integer column for weekly grouping
+    processed_df['dow'] = processed_df['date'].dt.dayofweek.astype('int8')
+    
+    # Index entries by date (sorted) so date filters become a binary-search slice.
+    # Only valid dates remain at this point; a NaT would leave the sorted index
+    # non-monotonic and make the slice raise KeyError.
+    processed_df = processed_df.set_index(pd.DatetimeIndex(processed_df['date'])).rename_axis(None).sort_index()
+    
+    # Display label for each entry's date, formatted in one vectorized pass
+    processed_df['date_str'] = processed_df['date'].dt.strftime('%Y-%m-%d')
+    
+    # CSS class used to color each entry's mood
+    scores = processed_df['sentiment_score']
+    processed_df['mood_class'] = np.select(
+        [scores > 0.1, scores < -0.1],
+        ['positive-mood', 'negative-mood'],
+        default='neutral-mood'
+    )
+    
+    if cache_path is not None:
+        _write_parquet_cache(processed_df, cache_path)
+    
+    processed_df['keywords'] = processed_df['keywords'].astype(KEYWORDS_DTYPE)
+    
+    return processed_df
+
+
+@st.cache_resource(show_spinner=False)
+def _store_entries(_file_bytes, file_digest, src_path, mtime):
+    """
+    Store processed entries in the database once per data source.
+    
+    Cached as a resource so the check only happens the first time a given
+    upload or file version is seen, not on every rerun. The database also
+    remembers each source's content hash, so unchanged data is not inserted
+    again after a restart.
+    
+    Returns:
+        int: Number of entries inserted
+    """
+    source_id = file_digest
+    if source_id is None:
+        with open(src_path, 'rb') as f:
+            source_id = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    
+    processed_df = _load_processed(_file_bytes, file_digest, src_path, mtime)
+    return get_db().insert_entries(processed_df, source_id=source_id)
+
+
 def load_and_process_data(uploaded_file=None):
     """
     Load journal data from CSV file and process it with sentiment analysis.
@@ -81,24 +244,28 @@ def load_and_process_data(uploaded_file=None):
         pd.DataFrame: Processed journal entries with sentiment analysis
     """
     try:
-        df = None
+        file_bytes, file_digest, src_path, mtime = None, None, None, None
         # Check if user uploaded a file
         if uploaded_file is not None:
             # Use uploaded file
-            df = pd.read_csv(uploaded_file)
-            st.success(f"✅ Loaded {len(df)} entries from your uploaded file")
+            file_bytes = uploaded_file.getvalue()
+            # Key the caches on a short content digest rather than having Streamlit hash the bytes
+            file_digest = hashlib.blake2b(file_bytes, digest_size=16).hexdigest()
+            processed_df = _load_processed(file_bytes, file_digest, None, None)
+            st.success(f"✅ Loaded {len(processed_df)} entries from your uploaded file")
         else:
             # Check for converted journal data first
             converted_file = 'data/journal_entries.csv'
             if os.path.exists(converted_file):
-                df = pd.read_csv(converted_file)
-                st.success(f"✅ Loaded {len(df)} entries from your converted journal data")
+                src_path, mtime = converted_file, os.path.getmtime(converted_file)
+                processed_df = _load_processed(None, None, src_path, mtime)
+                st.success(f"✅ Loaded {len(processed_df)} entries from your converted journal data")
                 st.info("📝 This is your personal journal data converted from Markdown files")
             else:
                 # Try to load sample data
                 sample_file = 'data/sample_journal_entries.csv'
                 if os.path.exists(sample_file):
-                    df = pd.read_csv(sample_file)
+                    processed_df = _load_processed(None, None, sample_file, os.path.getmtime(sample_file))
                     st.info("📝 Using sample data. Upload your own journal data or run convert_journal.py to convert your Markdown files!")
                 else:
                     st.error("❌ No journal data found!")
@@ -108,14 +275,9 @@ def load_and_process_data(uploaded_file=None):
                     st.info("   • Ensure sample data exists: data/sample_journal_entries.csv")
                     return None
         
-        # Process the data with sentiment analysis
-        processed_df = analyze_journal_entries(df)
-        
         # Store in database for persistence (only if using uploaded or converted data)
-        if uploaded_file is not None or os.path.exists('data/journal_entries.csv'):
-            db = JournalDatabase()
-            db.insert_entries(processed_df)
-            db.close()
+        if uploaded_file is not None or src_path is not None:
+            _store_entries(file_bytes, file_digest, src_path, mtime)
         
         return processed_df
         
@@ -138,11 +300,51 @@ def create_mood_timeline_chart(df):
     Returns:
         plotly.graph_objects.Figure: Interactive line chart
     """
-    # Prepare data for the timeline
-    timeline_data = df.copy()
-    timeline_data['date'] = pd.to_datetime(timeline_data['date'])
-    timeline_data = timeline_data.sort_values('date')
+    # Prepare data for the timeline (only the plotted columns go into the cache key)
+    timeline_data = df[['date', 'sentiment_score', 'title', 'mood_category']].sort_values('date')
+    
+    # Long journals are thinned out before plotting; the browser is the bottleneck there
+    if len(timeline_data) > TIMELINE_MAX_POINTS:
+        keep = _minmax_downsample(timeline_data['sentiment_score'].to_numpy(), TIMELINE_MAX_POINTS)
+        timeline_data = timeline_data.iloc[keep]
+    
+    return _timeline_figure(timeline_data)
+
+
+def _minmax_downsample(values, n_out):
+    """
+    Pick the positions of the lowest and highest value in equal-sized buckets.
     
+    Keeping each bucket's extremes (plus the first and last point) preserves the
+    peaks and dips of the line while cutting it down to about n_out points.
+    
+    Args:
+        values (np.ndarray): Values in plotting order
+        n_out (int): Approximate number of points to keep
+        
+    Returns:
+        np.ndarray: Sorted positions of the points to keep
+    """
+    bucket_size = -(-len(values) // max(n_out // 2, 1))
+    n_buckets = -(-len(values) // bucket_size)
+    
+    # Pad the last bucket with NaN so every bucket can be reduced in one call
+    buckets = np.full(n_buckets * bucket_size, np.nan)
+    buckets[:len(values)] = values
+    buckets = buckets.reshape(n_buckets, bucket_size)
+    
+    starts = np.arange(n_buckets) * bucket_size
+    keep = np.concatenate([
+        [0, len(values) - 1],
+        starts + np.nanargmin(buckets, axis=1),
+        starts + np.nanargmax(buckets, axis=1),
+    ])
+    return np.unique(keep)
+
+
+@st.cache_data(show_spinner=False)
+def _timeline_figure(timeline_data):
+    """Build the timeline figure; cached on the plotted columns."""
     # Create the line chart
     fig = px.line(
         timeline_data,
@@ -150,7 +352,8 @@ def create_mood_timeline_chart(df):
         y='sentiment_score',
         title='📈 Mood Timeline - Sentiment Over Time',
         labels={'sentiment_score': 'Sentiment Score', 'date': 'Date'},
-        hover_data=['title', 'mood_category']
+        hover_data=['title', 'mood_category'],
+        render_mode='webgl'
     )
     
     # Add a horizontal line at y=0 to show neutral sentiment
@@ -181,9 +384,15 @@ def create_mood_distribution_chart(df):
     Returns:
         plotly.graph_objects.Figure: Interactive histogram
     """
+    return _distribution_figure(df['sentiment_score'].to_numpy())
+
+
+@st.cache_data(show_spinner=False)
+def _distribution_figure(scores):
+    """Build the histogram figure; cached on the array of sentiment scores."""
     # Create histogram of sentiment scores
     fig = px.histogram(
-        df,
+        pd.DataFrame({'sentiment_score': scores}),
         x='sentiment_score',
         nbins=20,
         title='📊 Mood Distribution - How Often Each Mood Occurs',
@@ -191,17 +400,25 @@ def create_mood_distribution_chart(df):
         color_discrete_sequence=['#1f77b4']
     )
     
-    # Add vertical lines for mood boundaries
-    fig.add_vline(x=-0.5, line_dash="dash", line_color="red", 
-                  annotation_text="Very Negative")
-    fig.add_vline(x=-0.1, line_dash="dash", line_color="orange", 
-                  annotation_text="Negative")
-    fig.add_vline(x=0.1, line_dash="dash", line_color="gray", 
-                  annotation_text="Neutral")
-    fig.add_vline(x=0.5, line_dash="dash", line_color="green", 
-                  annotation_text="Positive")
+    # Vertical lines (with labels) for mood boundaries, added in a single layout update
+    boundaries = [
+        (-0.5, "red", "Very Negative"),
+        (-0.1, "orange", "Negative"),
+        (0.1, "gray", "Neutral"),
+        (0.5, "green", "Positive"),
+    ]
     
     fig.update_layout(
+        shapes=[
+            dict(type='line', x0=x, x1=x, xref='x', y0=0, y1=1, yref='paper',
+                 line=dict(dash='dash', color=color))
+            for x, color, _ in boundaries
+        ],
+        annotations=[
+            dict(x=x, y=1, xref='x', yref='paper', text=label, showarrow=False,
+                 xanchor='left', yanchor='top')
+            for x, _, label in boundaries
+        ],
         xaxis_title="Sentiment Score",
         yaxis_title="Number of Entries",
         height=400
@@ -223,24 +440,24 @@ def create_mood_category_pie(df):
     Returns:
         plotly.graph_objects.Figure: Interactive pie chart
     """
-    # Count entries by mood category
-    mood_counts = df['mood_category'].value_counts()
-    
-    # Define colors for each mood category
-    colors = {
-        'Very Negative': '#d62728',
-        'Negative': '#ff7f0e', 
-        'Neutral': '#7f7f7f',
-        'Positive': '#2ca02c',
-        'Very Positive': '#1f77b4'
-    }
+    # Count entries by mood category, kept in category order to line up with MOOD_COLORS
+    mood_counts = df['mood_category'].value_counts(sort=False)
+    
+    return _mood_pie_figure(tuple(mood_counts.items()))
+
+
+@st.cache_data(show_spinner=False)
+def _mood_pie_figure(mood_counts):
+    """Build the pie chart figure; cached on (mood, count) pairs."""
+    # Skip categories with no entries, keeping each remaining mood's color
+    shown = [(mood, count, color) for (mood, count), color in zip(mood_counts, MOOD_COLORS) if count > 0]
     
     # Create pie chart
     fig = px.pie(
-        values=mood_counts.values,
-        names=mood_counts.index,
+        values=[count for _, count, _ in shown],
+        names=[mood for mood, _, _ in shown],
         title='🥧 Mood Category Distribution',
-        color_discrete_map=colors
+        color_discrete_sequence=[color for _, _, color in shown]
     )
     
     fig.update_layout(height=400)
@@ -258,7 +475,7 @@ def create_wordcloud(df):
         df (pd.DataFrame): Processed journal entries
         
     Returns:
-        str: Base64 encoded image of the word cloud
+        np.ndarray: RGB image array of the word cloud
     """
     # Get common keywords across all entries
     common_keywords = get_common_keywords(df, top_n=50)
@@ -266,6 +483,12 @@ def create_wordcloud(df):
     if not common_keywords:
         return None
     
+    return _wordcloud_image(tuple(common_keywords))
+
+
+@st.cache_data(show_spinner=False)
+def _wordcloud_image(keyword_counts):
+    """Render the word cloud image; cached on (keyword, count) pairs."""
     # Create word cloud
     wordcloud = WordCloud(
         width=800,
@@ -273,22 +496,10 @@ def create_wordcloud(df):
         background_color='white',
         colormap='viridis',
         max_words=50
-    ).generate_from_frequencies(dict(common_keywords))
-    
-    # Convert to image
-    fig, ax = plt.subplots(figsize=(10, 5))
-    ax.imshow(wordcloud, interpolation='bilinear')
-    ax.axis('off')
-    ax.set_title('☁️ Most Common Words in Journal Entries', fontsize=16, pad=20)
+    ).generate_from_frequencies(dict(keyword_counts))
     
-    # Convert plot to base64 string for display
-    img_buffer = io.BytesIO()
-    plt.savefig(img_buffer, format='png', bbox_inches='tight', dpi=300)
-    img_buffer.seek(0)
-    img_str = base64.b64encode(img_buffer.getvalue()).decode()
-    plt.close()
-    
-    return img_str
+    # Streamlit encodes the RGB array itself, no matplotlib figure needed
+    return wordcloud.to_array()
 
 
 def create_weekly_mood_chart(df):
@@ -304,17 +515,22 @@ def create_weekly_mood_chart(df):
     Returns:
         plotly.graph_objects.Figure: Interactive bar chart
     """
-    # Add day of week column
-    df_copy = df.copy()
-    df_copy['day_of_week'] = pd.to_datetime(df_copy['date']).dt.day_name()
-    
-    # Calculate average sentiment by day of week
-    weekly_mood = df_copy.groupby('day_of_week')['sentiment_score'].mean().reset_index()
+    # Sum and count sentiment per day of week (Monday=0) straight from the int8 codes
+    dow = df['dow'].to_numpy()
+    sums = np.bincount(dow, weights=df['sentiment_score'].to_numpy(), minlength=7)
+    counts = np.bincount(dow, minlength=7)
     
-    # Define the correct order of days
+    # Average for each day that has entries, with day numbers mapped back to names
     day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    weekly_mood['day_of_week'] = pd.Categorical(weekly_mood['day_of_week'], categories=day_order, ordered=True)
-    weekly_mood = weekly_mood.sort_values('day_of_week')
+    day_means = tuple((day_order[day], float(sums[day] / counts[day])) for day in np.flatnonzero(counts))
+    
+    return _weekly_mood_figure(day_means)
+
+
+@st.cache_data(show_spinner=False)
+def _weekly_mood_figure(day_means):
+    """Build the weekly bar chart figure; cached on (day, mean) pairs."""
+    weekly_mood = pd.DataFrame(day_means, columns=['day_of_week', 'sentiment_score'])
     
     # Create bar chart
     fig = px.bar(
@@ -356,29 +572,22 @@ def display_entry_details(df, selected_entries):
     
     st.subheader("📝 Selected Entry Details")
     
-    for idx in selected_entries:
-        entry = df.iloc[idx]
-        
-        # Determine mood color class
-        sentiment = entry['sentiment_score']
-        if sentiment > 0.1:
-            mood_class = "positive-mood"
-        elif sentiment < -0.1:
-            mood_class = "negative-mood"
-        else:
-            mood_class = "neutral-mood"
+    # Select all rows at once and walk them as lightweight namedtuples
+    for entry in df.iloc[selected_entries].itertuples(index=False, name='Entry'):
+        sentiment = entry.sentiment_score
+        title = entry.title if pd.notna(entry.title) else 'No Title'
         
         # Display entry information
-        with st.expander(f"📅 {entry['date'].strftime('%Y-%m-%d')} - {entry.get('title', 'No Title')}"):
+        with st.expander(f"📅 {entry.date_str} - {title}"):
             col1, col2 = st.columns([3, 1])
             
             with col1:
                 st.write("**Content:**")
-                st.write(entry['content'])
+                st.write(entry.content)
                 
-                if entry.get('keywords'):
+                if entry.keywords:
                     st.write("**Keywords:**")
-                    st.write(", ".join(entry['keywords'][:10]))  # Show first 10 keywords
+                    st.write(", ".join(entry.keywords[:10]))  # Show first 10 keywords
             
             with col2:
                 st.metric(
@@ -386,7 +595,7 @@ def display_entry_details(df, selected_entries):
                     f"{sentiment:.3f}",
                     delta=None
                 )
-                st.markdown(f"<p class='{mood_class}'><strong>Mood:</strong> {entry['mood_category']}</p>", 
+                st.markdown(f"<p class='{entry.mood_class}'><strong>Mood:</strong> {entry.mood_category}</p>", 
                            unsafe_allow_html=True)
 
 
@@ -413,9 +622,6 @@ def main():
     if df is None or df.empty:
         st.warning("Please upload a journal file or convert your Markdown files to get started.")
         st.stop()
-        
-    # Convert date column to datetime objects
-    df['date'] = pd.to_datetime(df['date'])
 
     # --- Sidebar Filters ---
     st.sidebar.header("🗓️ Filter Options")
@@ -427,14 +633,11 @@ def main():
     # Quick filters
     st.sidebar.subheader("Quick Date Filters")
     if st.sidebar.button("Last 90 Days"):
-        st.session_state.start_date = max_date - timedelta(days=90)
-        st.session_state.end_date = max_date
+        st.session_state.date_range = (max_date - timedelta(days=90), max_date)
     if st.sidebar.button("This Year"):
-        st.session_state.start_date = datetime(max_date.year, 1, 1).date()
-        st.session_state.end_date = max_date
+        st.session_state.date_range = (datetime(max_date.year, 1, 1).date(), max_date)
     if st.sidebar.button("All Time"):
-        st.session_state.start_date = min_date
-        st.session_state.end_date = max_date
+        st.session_state.date_range = (min_date, max_date)
 
     # Define default dates and ensure they are within the data's range
     default_start = date(2025, 1, 1)
@@ -445,22 +648,26 @@ def main():
     if not (min_date <= default_end <= max_date):
         default_end = max_date
 
-    start_date = st.sidebar.date_input(
-        'Start date',
-        st.session_state.get('start_date', default_start),
-        min_value=min_date,
-        max_value=max_date,
-        key='start_date'
-    )
-    
-    end_date = st.sidebar.date_input(
-        'End date',
-        st.session_state.get('end_date', default_end),
+    # A single range picker returns both endpoints in one rerun
+    date_range = st.sidebar.date_input(
+        'Date range',
+        st.session_state.get('date_range', (default_start, default_end)),
         min_value=min_date,
         max_value=max_date,
-        key='end_date'
+        key='date_range'
     )
 
+    # Entries dropped for lack of a date can't fall inside any range
+    undated_count = df.attrs.get('undated_entries', 0)
+    if undated_count:
+        st.sidebar.caption(f"{undated_count} entries without a valid date are not shown.")
+
+    # While the user is still picking, only the start date is available
+    if len(date_range) == 2:
+        start_date, end_date = date_range
+    else:
+        start_date = end_date = date_range[0]
+
     # Mood category filter
     st.sidebar.subheader("😊 Mood Filter")
     mood_categories = ['All'] + df['mood_category'].unique().tolist()
@@ -470,11 +677,16 @@ def main():
         help="Filter the dashboard to show entries of a specific mood."
     )
     
+    # Chart selection
+    st.sidebar.subheader("📈 Chart View")
+    chart_view = st.sidebar.radio(
+        "Show chart",
+        ["📈 Timeline", "📊 Distribution", "🥧 Categories", "📅 Weekly Pattern", "☁️ Word Cloud"],
+        key='chart_view'
+    )
+    
     # --- Data Filtering ---
-    filtered_df = df[
-        (df['date'].dt.date >= start_date) & 
-        (df['date'].dt.date <= end_date)
-    ]
+    filtered_df = df.loc[str(start_date):str(end_date)]
     if selected_mood != 'All':
         filtered_df = filtered_df[filtered_df['mood_category'] == selected_mood]
 
@@ -529,48 +741,29 @@ def main():
     # Main visualizations
     st.subheader("📈 Mood Analysis")
     
-    # Create tabs for different visualizations
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
-        "📈 Timeline", "📊 Distribution", "🥧 Categories", "📅 Weekly Pattern", "☁️ Word Cloud"
-    ])
-    
-    with tab1:
-        if not filtered_df.empty:
-            timeline_fig = create_mood_timeline_chart(filtered_df)
-            st.plotly_chart(timeline_fig, use_container_width=True)
-        else:
-            st.info("No data available for the selected filters.")
+    # Only the selected chart is built; the others would be thrown away on every rerun
+    if chart_view == "📈 Timeline":
+        timeline_fig = create_mood_timeline_chart(filtered_df)
+        st.plotly_chart(timeline_fig, use_container_width=True)
     
-    with tab2:
-        if not filtered_df.empty:
-            dist_fig = create_mood_distribution_chart(filtered_df)
-            st.plotly_chart(dist_fig, use_container_width=True)
-        else:
-            st.info("No data available for the selected filters.")
+    elif chart_view == "📊 Distribution":
+        dist_fig = create_mood_distribution_chart(filtered_df)
+        st.plotly_chart(dist_fig, use_container_width=True)
     
-    with tab3:
-        if not filtered_df.empty:
-            pie_fig = create_mood_category_pie(filtered_df)
-            st.plotly_chart(pie_fig, use_container_width=True)
-        else:
-            st.info("No data available for the selected filters.")
+    elif chart_view == "🥧 Categories":
+        pie_fig = create_mood_category_pie(filtered_df)
+        st.plotly_chart(pie_fig, use_container_width=True)
     
-    with tab4:
-        if not filtered_df.empty:
-            weekly_fig = create_weekly_mood_chart(filtered_df)
-            st.plotly_chart(weekly_fig, use_container_width=True)
-        else:
-            st.info("No data available for the selected filters.")
+    elif chart_view == "📅 Weekly Pattern":
+        weekly_fig = create_weekly_mood_chart(filtered_df)
+        st.plotly_chart(weekly_fig, use_container_width=True)
     
-    with tab5:
-        if not filtered_df.empty:
-            wordcloud_img = create_wordcloud(filtered_df)
-            if wordcloud_img:
-                st.image(f"data:image/png;base64,{wordcloud_img}", use_column_width=True)
-            else:
-                st.info("No keywords found in the filtered entries.")
+    elif chart_view == "☁️ Word Cloud":
+        wordcloud_img = create_wordcloud(filtered_df)
+        if wordcloud_img is not None:
+            st.image(wordcloud_img, caption='☁️ Most Common Words in Journal Entries', use_column_width=True)
         else:
-            st.info("No data available for the selected filters.")
+            st.info("No keywords found in the filtered entries.")
     
     # Detailed Entry View
     st.header("✒️ Journal Entries")
@@ -582,7 +775,8 @@ def main():
         filtered_df[['date', 'title', 'mood_category', 'sentiment_score']]
         .sort_values('date', ascending=False)
         .head(10),
-        use_container_width=True
+        use_container_width=True,
+        hide_index=True
     )
 
 
@@ -6,11 +6,46 @@ inserting processed journal entries, and querying data for the dashboard.
 """
 
 import sqlite3
+import threading
+import importlib.util
+from itertools import chain
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 
 
+# Rows passed to each executemany call when inserting entries
+INSERT_BATCH_SIZE = 10_000
+
+# Rows per multi-row INSERT statement; 6 parameters each stays under SQLite's
+# historical limit of 999 bound parameters per statement
+ROWS_PER_STATEMENT = 999 // 6
+
+# Inserts larger than this drop the entry indexes and rebuild them afterwards,
+# which is cheaper than updating both b-trees row by row
+REINDEX_THRESHOLD = 10_000
+
+# Indexes on journal_entries: date for faster queries, sentiment_score for mood filtering
+ENTRY_INDEXES = {
+    'idx_date': 'CREATE INDEX IF NOT EXISTS idx_date ON journal_entries(date)',
+    'idx_sentiment': 'CREATE INDEX IF NOT EXISTS idx_sentiment ON journal_entries(sentiment_score)',
+}
+
+# Query results use Arrow-backed columns when pyarrow is installed
+DTYPE_BACKEND = 'pyarrow' if importlib.util.find_spec('pyarrow') is not None else 'numpy_nullable'
+
+
+def _insert_sql(row_count: int) -> str:
+    """INSERT statement for journal_entries with row_count rows of placeholders."""
+    values = ', '.join(['(?, ?, ?, ?, ?, ?)'] * row_count)
+    return f'''
+        INSERT INTO journal_entries 
+        (date, title, content, sentiment_score, mood_category, keywords)
+        VALUES {values}
+    '''
+
+
 class JournalDatabase:
     """
     A class to handle all database operations for the mood journaling app.
@@ -34,6 +69,9 @@ class JournalDatabase:
         
         self.db_path = db_path
         self.conn = None
+        # The connection may be shared by Streamlit's session threads, so every
+        # use of it is serialized. Reentrant because insert_entries calls has_source.
+        self._lock = threading.RLock()
         self._create_tables()
     
     def _create_tables(self):
@@ -46,10 +84,20 @@ class JournalDatabase:
         - Keywords extracted from entries
         """
         try:
-            # Connect to the database (creates it if it doesn't exist)
-            self.conn = sqlite3.connect(self.db_path)
+            # Connect to the database (creates it if it doesn't exist).
+            # The connection may be shared across Streamlit's script threads.
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
             cursor = self.conn.cursor()
             
+            # WAL lets readers run alongside writes, and NORMAL sync is safe under WAL
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+            cursor.execute('PRAGMA temp_store=MEMORY')
+            # Memory-map up to 256 MB of the file and keep a 64 MB page cache
+            cursor.execute('PRAGMA mmap_size=268435456')
+            cursor.execute('PRAGMA cache_size=-65536')
+            cursor.execute('PRAGMA foreign_keys=ON')
+            
             # Create the main journal entries table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS journal_entries (
@@ -64,14 +112,21 @@ class JournalDatabase:
                 )
             ''')
             
-            # Create an index on the date column for faster queries
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_date ON journal_entries(date)
-            ''')
+            # Create the indexes on date and sentiment_score
+            for index_sql in ENTRY_INDEXES.values():
+                cursor.execute(index_sql)
+            
+            # Full-text index over title and content, kept in sync by triggers.
+            # The trigram tokenizer matches arbitrary substrings like LIKE did.
+            self.has_fts = self._create_fts_index(cursor)
             
-            # Create an index on sentiment_score for mood filtering
+            # Track which data sources (by content hash) have already been stored
             cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_sentiment ON journal_entries(sentiment_score)
+                CREATE TABLE IF NOT EXISTS imported_sources (
+                    source_id TEXT PRIMARY KEY,
+                    entry_count INTEGER,
+                    imported_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
             ''')
             
             self.conn.commit()
@@ -81,7 +136,54 @@ class JournalDatabase:
             print(f"Database error: {e}")
             raise
     
-    def insert_entries(self, df: pd.DataFrame) -> int:
+    def _create_fts_index(self, cursor) -> bool:
+        """
+        Create the FTS5 search index and its sync triggers if they don't exist.
+        
+        Args:
+            cursor: Cursor on the open connection
+            
+        Returns:
+            bool: True if the index is available, False if this SQLite build lacks FTS5
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'journal_fts'")
+        if cursor.fetchone() is not None:
+            return True
+        
+        try:
+            cursor.execute('''
+                CREATE VIRTUAL TABLE journal_fts USING fts5(
+                    title, content,
+                    content='journal_entries', content_rowid='id',
+                    tokenize='trigram'
+                )
+            ''')
+        except sqlite3.OperationalError as e:
+            print(f"Full-text search unavailable, falling back to LIKE: {e}")
+            return False
+        
+        cursor.executescript('''
+            CREATE TRIGGER IF NOT EXISTS journal_fts_insert AFTER INSERT ON journal_entries BEGIN
+                INSERT INTO journal_fts(rowid, title, content)
+                VALUES (new.id, new.title, new.content);
+            END;
+            CREATE TRIGGER IF NOT EXISTS journal_fts_delete AFTER DELETE ON journal_entries BEGIN
+                INSERT INTO journal_fts(journal_fts, rowid, title, content)
+                VALUES ('delete', old.id, old.title, old.content);
+            END;
+            CREATE TRIGGER IF NOT EXISTS journal_fts_update AFTER UPDATE ON journal_entries BEGIN
+                INSERT INTO journal_fts(journal_fts, rowid, title, content)
+                VALUES ('delete', old.id, old.title, old.content);
+                INSERT INTO journal_fts(rowid, title, content)
+                VALUES (new.id, new.title, new.content);
+            END;
+        ''')
+        
+        # Index any entries stored before the search index existed
+        cursor.execute("INSERT INTO journal_fts(journal_fts) VALUES ('rebuild')")
+        return True
+    
+    def insert_entries(self, df: pd.DataFrame, source_id: Optional[str] = None) -> int:
         """
         Insert processed journal entries into the database.
         
@@ -91,73 +193,234 @@ class JournalDatabase:
         Args:
             df (pd.DataFrame): DataFrame with columns: date, title, content, 
                               sentiment_score, mood_category, keywords
+            source_id (str, optional): Content hash of the file the entries came from.
+                              If this source was already stored, nothing is inserted.
                               
         Returns:
             int: Number of entries successfully inserted
         """
-        if self.conn is None:
-            self._create_tables()
+        if source_id is not None and self.has_source(source_id):
+            print("Entries from this source are already stored, skipping insert")
+            return 0
         
         cursor = self.conn.cursor()
         inserted_count = 0
-        
-        try:
-            # Prepare the data for insertion
-            for _, row in df.iterrows():
-                # Convert keywords list to string for storage
-                keywords_str = ','.join(row.get('keywords', [])) if row.get('keywords') else ''
+        n = len(df)
+        
+        # Pull each column out as an array once instead of boxing values row by row
+        if pd.api.types.is_datetime64_any_dtype(df['date']):
+            dates = df['date'].dt.strftime('%Y-%m-%d %H:%M:%S').to_numpy()
+        else:
+            dates = df['date'].astype(str).to_numpy()
+        # Missing titles (NaN or pd.NA) are stored as NULL
+        if 'title' in df.columns:
+            titles = df['title'].astype(object).where(df['title'].notna(), None).to_numpy()
+        else:
+            titles = np.full(n, '', dtype=object)
+        contents = df['content'].to_numpy()
+        if 'sentiment_score' in df.columns:
+            scores = df['sentiment_score'].to_numpy()
+        else:
+            scores = np.zeros(n)
+        if 'mood_category' in df.columns:
+            moods = df['mood_category'].astype(object).to_numpy()
+        else:
+            moods = np.full(n, 'Neutral', dtype=object)
+        # Convert keywords lists to strings for storage
+        if 'keywords' in df.columns and isinstance(df['keywords'].dtype, pd.ArrowDtype):
+            # Arrow list<string> column: join in Arrow without creating Python lists
+            import pyarrow as pa
+            import pyarrow.compute as pc
+            joined = pc.binary_join(pa.array(df['keywords']), ',')
+            keywords = pc.fill_null(joined, '').to_numpy(zero_copy_only=False)
+        elif 'keywords' in df.columns:
+            keywords = df['keywords'].str.join(',').fillna('').to_numpy()
+        else:
+            keywords = np.full(n, '', dtype=object)
+        columns = (dates, titles, contents, scores, moods, keywords)
+        
+        with self._lock:
+            # Take the write lock up front; everything below is one transaction.
+            # Opened outside the try so a failed BEGIN never rolls back anything else.
+            cursor.execute('BEGIN IMMEDIATE')
+            try:
+                # Check again inside the transaction, so two imports of one source
+                # (even from separate connections) cannot both get past it
+                if source_id is not None and self.has_source(source_id):
+                    self.conn.rollback()
+                    print("Entries from this source are already stored, skipping insert")
+                    return 0
                 
-                cursor.execute('''
-                    INSERT INTO journal_entries 
-                    (date, title, content, sentiment_score, mood_category, keywords)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (
-                    str(row['date']),
-                    row.get('title', ''),
-                    row['content'],
-                    row.get('sentiment_score', 0.0),
-                    row.get('mood_category', 'Neutral'),
-                    keywords_str
-                ))
-                inserted_count += 1
-            
-            self.conn.commit()
-            print(f"Successfully inserted {inserted_count} entries")
-            
-        except sqlite3.Error as e:
-            print(f"Error inserting entries: {e}")
-            self.conn.rollback()
-            raise
+                rebuild_indexes = n > REINDEX_THRESHOLD
+                if rebuild_indexes:
+                    for index_name in ENTRY_INDEXES:
+                        cursor.execute(f'DROP INDEX IF EXISTS {index_name}')
+                
+                # Inserted in batches to bound per-call memory. Each statement carries
+                # many rows, which is much cheaper per row than one-row statements
+                # (especially with the search index triggers).
+                multi_row_sql = _insert_sql(ROWS_PER_STATEMENT)
+                for start in range(0, n, INSERT_BATCH_SIZE):
+                    batch = slice(start, start + INSERT_BATCH_SIZE)
+                    rows = list(zip(*(column[batch] for column in columns)))
+                    full = len(rows) - len(rows) % ROWS_PER_STATEMENT
+                    cursor.executemany(multi_row_sql, (
+                        tuple(chain.from_iterable(rows[i:i + ROWS_PER_STATEMENT]))
+                        for i in range(0, full, ROWS_PER_STATEMENT)
+                    ))
+                    if full < len(rows):
+                        cursor.execute(_insert_sql(len(rows) - full), tuple(chain.from_iterable(rows[full:])))
+                inserted_count = n
+                
+                if rebuild_indexes:
+                    for index_sql in ENTRY_INDEXES.values():
+                        cursor.execute(index_sql)
+                
+                # Record the source in the same transaction as its entries
+                if source_id is not None:
+                    cursor.execute(
+                        'INSERT INTO imported_sources (source_id, entry_count) VALUES (?, ?)',
+                        (source_id, inserted_count)
+                    )
+                
+                self.conn.commit()
+                print(f"Successfully inserted {inserted_count} entries")
+                
+            except Exception as e:
+                print(f"Error inserting entries: {e}")
+                self.conn.rollback()
+                raise
         
         return inserted_count
     
-    def get_all_entries(self) -> pd.DataFrame:
+    def has_source(self, source_id: str) -> bool:
         """
-        Retrieve all journal entries from the database.
+        Check whether entries from a data source have already been stored.
         
+        Args:
+            source_id (str): Content hash of the source file
+            
         Returns:
-            pd.DataFrame: DataFrame with all journal entries and their analysis
+            bool: True if insert_entries was already called with this source_id
         """
-        if self.conn is None:
-            self._create_tables()
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute('SELECT 1 FROM imported_sources WHERE source_id = ?', (source_id,))
+            return cursor.fetchone() is not None
+    
+    @staticmethod
+    def _parse_entries(df: pd.DataFrame) -> pd.DataFrame:
+        """Convert the stored keywords string back to lists (empty string -> [])."""
+        df['keywords'] = df['keywords'].fillna('').str.findall(r'[^,]+')
+        return df
+    
+    def _read_entries(self, query: str, params: Optional[List] = None,
+                      chunksize: Optional[int] = None):
+        """
+        Run an entries query, parsing dates in pandas and keywords as lists.
+        
+        Args:
+            query (str): SELECT returning date, title, content, sentiment_score,
+                         mood_category, keywords
+            params (list, optional): Query parameters
+            chunksize (int, optional): If given, return an iterator of DataFrames
+                         with at most this many rows each
+            
+        Returns:
+            pd.DataFrame or Iterator[pd.DataFrame]: The matching entries
+        """
+        if chunksize is None:
+            with self._lock:
+                result = pd.read_sql_query(query, self.conn, params=params,
+                                           parse_dates=['date'],
+                                           dtype_backend=DTYPE_BACKEND)
+            return self._parse_entries(result)
+        return self._iter_entries(query, params, chunksize)
+    
+    def _iter_entries(self, query: str, params: Optional[List], chunksize: int):
+        """
+        Yield entry chunks from a separate, short-lived read connection.
         
-        query = '''
+        A caller may stop iterating at any point, so the stream never holds the
+        shared connection or its lock between chunks. Under WAL the extra
+        connection reads alongside writes on the shared one.
+        """
+        # The iterator may be advanced or closed from another thread
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        try:
+            for chunk in pd.read_sql_query(query, conn, params=params,
+                                           parse_dates=['date'], chunksize=chunksize,
+                                           dtype_backend=DTYPE_BACKEND):
+                yield self._parse_entries(chunk)
+        finally:
+            conn.close()
+    
+    def query_entries(self, date_range: Optional[Tuple[str, str]] = None,
+                      moods: Optional[List[str]] = None,
+                      search: Optional[str] = None,
+                      chunksize: Optional[int] = None):
+        """
+        Retrieve journal entries matching all of the given filters.
+        
+        Every filter runs inside SQLite (using the date index and the full-text
+        index), so only matching rows are loaded into pandas.
+        
+        Args:
+            date_range (tuple, optional): (start_date, end_date) in YYYY-MM-DD format
+            moods (list, optional): Mood categories to include
+            search (str, optional): Text to search for in content or title
+            chunksize (int, optional): Stream the entries as DataFrames of at most
+                                       this many rows instead of loading them all
+            
+        Returns:
+            pd.DataFrame: Matching entries, newest first
+                          (an iterator of DataFrames when chunksize is given)
+        """
+        clauses = []
+        params = []
+        
+        if date_range is not None:
+            clauses.append('date BETWEEN ? AND ?')
+            params.extend(date_range)
+        
+        if moods is not None:
+            clauses.append(f"mood_category IN ({', '.join('?' * len(moods))})")
+            params.extend(moods)
+        
+        if search is not None:
+            # Trigram queries need at least three characters; shorter terms use LIKE
+            if self.has_fts and len(search) >= 3:
+                clauses.append('id IN (SELECT rowid FROM journal_fts WHERE journal_fts MATCH ?)')
+                # Quote the term so it is matched literally rather than as query syntax
+                params.append('"' + search.replace('"', '""') + '"')
+            else:
+                clauses.append('(content LIKE ? OR title LIKE ?)')
+                search_pattern = f'%{search}%'
+                params.extend([search_pattern, search_pattern])
+        
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        query = f'''
             SELECT date, title, content, sentiment_score, mood_category, keywords
             FROM journal_entries
+            {where}
             ORDER BY date DESC
         '''
         
-        df = pd.read_sql_query(query, self.conn)
-        
-        # Convert date strings back to datetime
-        df['date'] = pd.to_datetime(df['date'])
+        return self._read_entries(query, params, chunksize=chunksize)
+    
+    def get_all_entries(self, chunksize: Optional[int] = None):
+        """
+        Retrieve all journal entries from the database.
         
-        # Convert keywords string back to list
-        df['keywords'] = df['keywords'].apply(
-            lambda x: x.split(',') if x else []
-        )
+        Args:
+            chunksize (int, optional): Stream the entries as DataFrames of at most
+                                       this many rows instead of loading them all
         
-        return df
+        Returns:
+            pd.DataFrame: DataFrame with all journal entries and their analysis
+                          (an iterator of DataFrames when chunksize is given)
+        """
+        return self.query_entries(chunksize=chunksize)
     
     def get_entries_by_date_range(self, start_date: str, end_date: str) -> pd.DataFrame:
         """
@@ -170,27 +433,7 @@ class JournalDatabase:
         Returns:
             pd.DataFrame: Filtered entries within the date range
         """
-        if self.conn is None:
-            self._create_tables()
-        
-        query = '''
-            SELECT date, title, content, sentiment_score, mood_category, keywords
-            FROM journal_entries
-            WHERE date BETWEEN ? AND ?
-            ORDER BY date DESC
-        '''
-        
-        df = pd.read_sql_query(query, self.conn, params=[start_date, end_date])
-        
-        # Convert date strings back to datetime
-        df['date'] = pd.to_datetime(df['date'])
-        
-        # Convert keywords string back to list
-        df['keywords'] = df['keywords'].apply(
-            lambda x: x.split(',') if x else []
-        )
-        
-        return df
+        return self.query_entries(date_range=(start_date, end_date))
     
     def get_entries_by_mood(self, mood_category: str) -> pd.DataFrame:
         """
@@ -202,27 +445,7 @@ class JournalDatabase:
         Returns:
             pd.DataFrame: Entries with the specified mood
         """
-        if self.conn is None:
-            self._create_tables()
-        
-        query = '''
-            SELECT date, title, content, sentiment_score, mood_category, keywords
-            FROM journal_entries
-            WHERE mood_category = ?
-            ORDER BY date DESC
-        '''
-        
-        df = pd.read_sql_query(query, self.conn, params=[mood_category])
-        
-        # Convert date strings back to datetime
-        df['date'] = pd.to_datetime(df['date'])
-        
-        # Convert keywords string back to list
-        df['keywords'] = df['keywords'].apply(
-            lambda x: x.split(',') if x else []
-        )
-        
-        return df
+        return self.query_entries(moods=[mood_category])
     
     def search_entries(self, search_term: str) -> pd.DataFrame:
         """
@@ -234,70 +457,57 @@ class JournalDatabase:
         Returns:
             pd.DataFrame: Entries containing the search term
         """
-        if self.conn is None:
-            self._create_tables()
-        
-        query = '''
-            SELECT date, title, content, sentiment_score, mood_category, keywords
-            FROM journal_entries
-            WHERE content LIKE ? OR title LIKE ?
-            ORDER BY date DESC
-        '''
-        
-        search_pattern = f'%{search_term}%'
-        df = pd.read_sql_query(query, self.conn, params=[search_pattern, search_pattern])
-        
-        # Convert date strings back to datetime
-        df['date'] = pd.to_datetime(df['date'])
-        
-        # Convert keywords string back to list
-        df['keywords'] = df['keywords'].apply(
-            lambda x: x.split(',') if x else []
-        )
-        
-        return df
+        return self.query_entries(search=search_term)
     
     def get_mood_statistics(self) -> Dict:
         """
         Get aggregated mood statistics from the database.
         
+        All aggregates are computed by SQLite in a single query, so no entry
+        rows are loaded into Python.
+        
         Returns:
-            Dict: Dictionary containing mood statistics
+            Dict: Dictionary containing mood statistics (total_entries,
+                  average_sentiment, most_common_mood, first_date, last_date,
+                  mood_distribution, monthly_sentiment)
         """
-        if self.conn is None:
-            self._create_tables()
-        
-        stats = {}
-        
-        # Get basic counts
-        cursor = self.conn.cursor()
-        
-        # Total entries
-        cursor.execute('SELECT COUNT(*) FROM journal_entries')
-        stats['total_entries'] = cursor.fetchone()[0]
-        
-        # Average sentiment
-        cursor.execute('SELECT AVG(sentiment_score) FROM journal_entries')
-        stats['average_sentiment'] = cursor.fetchone()[0] or 0.0
-        
-        # Mood distribution
-        cursor.execute('''
-            SELECT mood_category, COUNT(*) 
-            FROM journal_entries 
-            GROUP BY mood_category
-        ''')
-        mood_counts = dict(cursor.fetchall())
-        stats['mood_distribution'] = mood_counts
-        
-        # Monthly sentiment averages
-        cursor.execute('''
-            SELECT strftime('%Y-%m', date) as month, AVG(sentiment_score)
-            FROM journal_entries
-            GROUP BY month
-            ORDER BY month
-        ''')
-        monthly_data = cursor.fetchall()
-        stats['monthly_sentiment'] = {month: avg for month, avg in monthly_data}
+        with self._lock:
+            cursor = self.conn.cursor()
+            
+            # One row of totals, then one row per mood and one per month
+            cursor.execute('''
+                WITH moods AS (
+                    SELECT mood_category, COUNT(*) AS n
+                    FROM journal_entries
+                    GROUP BY mood_category
+                ),
+                months AS (
+                    SELECT strftime('%Y-%m', date) AS month, AVG(sentiment_score) AS avg_sentiment
+                    FROM journal_entries
+                    GROUP BY month
+                )
+                SELECT 0 AS kind, NULL AS label, COUNT(*), AVG(sentiment_score),
+                       (SELECT mood_category FROM moods ORDER BY n DESC LIMIT 1),
+                       MIN(date), MAX(date)
+                FROM journal_entries
+                UNION ALL
+                SELECT 1, mood_category, n, NULL, NULL, NULL, NULL FROM moods
+                UNION ALL
+                SELECT 2, month, NULL, avg_sentiment, NULL, NULL, NULL FROM months
+                ORDER BY kind, label
+            ''')
+            rows = cursor.fetchall()
+        
+        _, _, total, average, most_common, first_date, last_date = rows[0]
+        stats = {
+            'total_entries': total,
+            'average_sentiment': average or 0.0,
+            'most_common_mood': most_common,
+            'first_date': first_date,
+            'last_date': last_date,
+            'mood_distribution': {label: n for kind, label, n, *_ in rows if kind == 1},
+            'monthly_sentiment': {label: avg for kind, label, _, avg, *_ in rows if kind == 2},
+        }
         
         return stats
     
@@ -307,20 +517,19 @@ class JournalDatabase:
         
         Warning: This will delete all journal entries!
         """
-        if self.conn is None:
-            self._create_tables()
-        
-        cursor = self.conn.cursor()
-        cursor.execute('DELETE FROM journal_entries')
-        self.conn.commit()
-        print("Database cleared")
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute('DELETE FROM journal_entries')
+            cursor.execute('DELETE FROM imported_sources')
+            self.conn.commit()
+            print("Database cleared")
     
     def close(self):
         """
         Close the database connection.
         
         Always call this when you're done with the database to free up resources.
+        Any later query on this instance raises sqlite3.ProgrammingError.
         """
-        if self.conn:
-            self.conn.close()
-            self.conn = None 
\ No newline at end of file
+        with self._lock:
+            self.conn.close() 
\ No newline at end of file
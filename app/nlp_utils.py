@@ -6,11 +6,46 @@ using TextBlob for sentiment analysis and basic text processing.
 """
 
 import re
+from collections import Counter
+from itertools import chain
 from typing import Dict, List, Tuple, Optional
-from textblob import TextBlob
+from textblob.sentiments import PatternAnalyzer
+import numpy as np
 import pandas as pd
 
 
+# Mood labels in order from most negative to most positive (see categorize_mood)
+MOOD_CATEGORIES = ['Very Negative', 'Negative', 'Neutral', 'Positive', 'Very Positive']
+
+# Upper (inclusive) sentiment bound of every mood category except the last
+MOOD_THRESHOLDS = [-0.5, -0.1, 0.1, 0.5]
+
+# TextBlob's default sentiment analyzer, created once and reused for every entry
+_ANALYZER = PatternAnalyzer()
+
+# Common English stop words excluded from keywords
+_STOP_WORDS = frozenset({
+    'about', 'above', 'after', 'again', 'against', 'all', 'am', 'an', 'and', 'any', 'are', 'as', 'at',
+    'be', 'because', 'been', 'before', 'being', 'below', 'between', 'both', 'but', 'by',
+    'can', 'could', 'did', 'do', 'does', 'doing', 'down', 'during', 'each',
+    'few', 'for', 'from', 'further', 'had', 'has', 'have', 'having', 'he', 'her', 'here', 'hers', 'herself',
+    'him', 'himself', 'his', 'how', 'if', 'in', 'into', 'is', 'it', 'its', 'itself',
+    'just', 'me', 'more', 'most', 'my', 'myself', 'no', 'nor', 'not', 'now', 'of', 'off', 'on', 'once',
+    'only', 'or', 'other', 'our', 'ours', 'ourselves', 'out', 'over', 'own', 'same', 'she', 'should', 'so',
+    'some', 'still', 'such', 'than', 'that', 'the', 'their', 'theirs', 'them', 'themselves', 'then', 'there',
+    'these', 'they', 'this', 'those', 'through', 'to', 'too', 'under', 'until', 'up', 'very', 'was', 'we',
+    'were', 'what', 'when', 'where', 'which', 'while', 'who', 'whom', 'why', 'will', 'with', 'would',
+    'you', 'your', 'yours', 'yourself', 'yourselves', 'like', 'im', 'ive', 'also', 'get', 'got'
+})
+
+# Characters str.split() breaks words on, spelled out because pandas may run the
+# pattern with pyarrow's regex engine, where \s only matches ASCII whitespace
+_WHITESPACE = '\t\n\x0b\x0c\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000'
+
+# Anything that is not a lowercase letter or whitespace (punctuation, digits, accents)
+_NON_ALPHA = re.compile(f'[^a-z{_WHITESPACE}]+')
+
+
 def analyze_sentiment(text: str) -> float:
     """
     Analyze the sentiment of a given text using TextBlob.
@@ -25,12 +60,34 @@ def analyze_sentiment(text: str) -> float:
     Returns:
         float: Sentiment polarity score between -1 and 1
     """
-    # Create a TextBlob object from the input text
-    blob = TextBlob(text)
+    # Run TextBlob's pattern analyzer directly, without building a TextBlob.
+    # The polarity (how positive/negative the text is) is based on
+    # predefined sentiment lexicons and rules
+    polarity, subjectivity = _ANALYZER.analyze(text)
+    return polarity, subjectivity
+
+
+def analyze_sentiment_batch(texts: pd.Series) -> np.ndarray:
+    """
+    Analyze the sentiment of many texts at once.
+    
+    Identical texts (repeated templates, empty entries) are scored only once
+    and the results are broadcast back to every row.
     
-    # Extract the sentiment polarity (how positive/negative the text is)
-    # This is based on predefined sentiment lexicons and rules
-    return blob.sentiment.polarity, blob.sentiment.subjectivity
+    Args:
+        texts (pd.Series): Texts to analyze (journal entry contents)
+        
+    Returns:
+        np.ndarray: Structured array with float 'polarity' and 'subjectivity'
+                    fields, one element per text
+    """
+    codes, unique_texts = pd.factorize(texts, use_na_sentinel=False)
+    unique_scores = np.fromiter(
+        (analyze_sentiment(text) for text in unique_texts),
+        dtype=[('polarity', 'f8'), ('subjectivity', 'f8')],
+        count=len(unique_texts)
+    )
+    return unique_scores[codes]
 
 
 def categorize_mood(sentiment_score: float) -> str:
@@ -73,35 +130,19 @@ def extract_keywords(text: str, min_length: int = 4, max_words: int = 50) -> Lis
     Returns:
         List[str]: List of cleaned keywords
     """
-    # Convert to lowercase and split into words
-    words = text.lower().split()
-    
-    # A more comprehensive list of English stop words
-    stop_words = {
-        'about', 'above', 'after', 'again', 'against', 'all', 'am', 'an', 'and', 'any', 'are', 'as', 'at',
-        'be', 'because', 'been', 'before', 'being', 'below', 'between', 'both', 'but', 'by',
-        'can', 'could', 'did', 'do', 'does', 'doing', 'down', 'during', 'each',
-        'few', 'for', 'from', 'further', 'had', 'has', 'have', 'having', 'he', 'her', 'here', 'hers', 'herself',
-        'him', 'himself', 'his', 'how', 'if', 'in', 'into', 'is', 'it', 'its', 'itself',
-        'just', 'me', 'more', 'most', 'my', 'myself', 'no', 'nor', 'not', 'now', 'of', 'off', 'on', 'once',
-        'only', 'or', 'other', 'our', 'ours', 'ourselves', 'out', 'over', 'own', 'same', 'she', 'should', 'so',
-        'some', 'still', 'such', 'than', 'that', 'the', 'their', 'theirs', 'them', 'themselves', 'then', 'there',
-        'these', 'they', 'this', 'those', 'through', 'to', 'too', 'under', 'until', 'up', 'very', 'was', 'we',
-        'were', 'what', 'when', 'where', 'which', 'while', 'who', 'whom', 'why', 'will', 'with', 'would',
-        'you', 'your', 'yours', 'yourself', 'yourselves', 'like', 'im', 'ive', 'also', 'get', 'got'
-    }
-    
-    # Clean and filter words
-    cleaned_words = []
-    for word in words:
-        # Remove punctuation and numbers
-        clean_word = re.sub(r'[^a-zA-Z]', '', word)
-        
-        # Only include words that meet our criteria
-        if (len(clean_word) >= min_length and 
-            clean_word not in stop_words and 
-            clean_word.isalpha()):
-            cleaned_words.append(clean_word)
+    # Lowercase, strip punctuation and numbers inside words, then split into words
+    words = _NON_ALPHA.sub('', text.lower()).split()
+    
+    return _filter_keywords(words, min_length, max_words)
+
+
+def _filter_keywords(words: List[str], min_length: int = 4, max_words: int = 50) -> List[str]:
+    """Keep cleaned words that are long enough and not stop words, up to max_words."""
+    # Only include words that meet our criteria
+    cleaned_words = [
+        word for word in words
+        if len(word) >= min_length and word not in _STOP_WORDS
+    ]
     
     # Return the most frequent words (up to max_words)
     return cleaned_words[:max_words]
@@ -121,24 +162,36 @@ def analyze_journal_entries(df: pd.DataFrame) -> pd.DataFrame:
         pd.DataFrame: Original dataframe with added columns:
             - sentiment_score: Numerical sentiment (-1 to 1)
             - subjectivity_score: Numerical subjectivity (0 to 1)
-            - mood_category: Categorical mood label
+            - mood_category: Mood label (ordered Categorical of MOOD_CATEGORIES)
             - keywords: List of extracted keywords
     """
     # Create a copy to avoid modifying the original dataframe
     processed_df = df.copy()
     
-    # Add sentiment analysis columns
-    sentiments = processed_df['content'].apply(lambda text: analyze_sentiment(text))
-    processed_df['sentiment_score'] = sentiments.apply(lambda x: x[0])
-    processed_df['subjectivity_score'] = sentiments.apply(lambda x: x[1])
-    processed_df['mood_category'] = processed_df['sentiment_score'].apply(categorize_mood)
-    
-    # Extract keywords from content
-    processed_df['keywords'] = processed_df['content'].apply(extract_keywords)
-    
-    # Convert date column to datetime if it's not already
-    if 'date' in processed_df.columns:
-        processed_df['date'] = pd.to_datetime(processed_df['date'])
+    # Add sentiment analysis columns, scored in one batch
+    sentiments = analyze_sentiment_batch(processed_df['content'])
+    processed_df['sentiment_score'] = sentiments['polarity']
+    processed_df['subjectivity_score'] = sentiments['subjectivity']
+    
+    # Same buckets as categorize_mood, stored as an ordered Categorical
+    mood_codes = np.searchsorted(MOOD_THRESHOLDS, sentiments['polarity'])
+    processed_df['mood_category'] = pd.Categorical.from_codes(
+        mood_codes, categories=MOOD_CATEGORIES, ordered=True
+    )
+    
+    # Extract keywords from content (same cleaning as extract_keywords, done on
+    # the whole column with pandas string methods; only the filter runs per entry)
+    words = (
+        processed_df['content']
+        .str.lower()
+        .str.replace(_NON_ALPHA.pattern, '', regex=True)
+        .str.split()
+    )
+    processed_df['keywords'] = [_filter_keywords(entry_words) for entry_words in words]
+    
+    # Convert date column to datetime if it's not already (e.g. parsed by read_csv)
+    if 'date' in processed_df.columns and not pd.api.types.is_datetime64_any_dtype(processed_df['date']):
+        processed_df['date'] = pd.to_datetime(processed_df['date'], cache=True)
     
     return processed_df
 
@@ -187,16 +240,8 @@ def get_common_keywords(df: pd.DataFrame, top_n: int = 20) -> List[Tuple[str, in
     Returns:
         List[Tuple[str, int]]: List of (keyword, frequency) tuples
     """
-    # Flatten all keywords into a single list
-    all_keywords = []
-    for keywords in df['keywords']:
-        all_keywords.extend(keywords)
-    
-    # Count keyword frequencies
-    keyword_counts = {}
-    for keyword in all_keywords:
-        keyword_counts[keyword] = keyword_counts.get(keyword, 0) + 1
-    
-    # Sort by frequency and return top N
-    sorted_keywords = sorted(keyword_counts.items(), key=lambda x: x[1], reverse=True)
-    return sorted_keywords[:top_n] 
\ No newline at end of file
+    # Count keywords across all entries without building a flattened list
+    keyword_counts = Counter(chain.from_iterable(df['keywords']))
+    
+    # Return the top N by frequency
+    return keyword_counts.most_common(top_n) 
\ No newline at end of file
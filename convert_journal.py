@@ -14,11 +14,28 @@ The script:
 
 import os
 import re
-import pandas as pd
 from datetime import datetime
 from pathlib import Path
 import argparse
-
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Threads used to read journal files; reads are latency-bound, not CPU-bound
+READ_WORKERS = 16
+
+# Filename patterns, compiled once rather than on every file
+_MONTH_MAP = {'jan':1, 'feb':2, 'mar':3, 'apr':4, 'may':5, 'jun':6, 'jul':7, 'aug':8, 'sep':9, 'oct':10, 'nov':11, 'dec':12}
+_HASH_SUFFIX = re.compile(r'\s[a-f0-9]{32}$')
+# One pass over the name. Either a numeric month/day/year at the start, optionally
+# after a day of week ("Friday 1 10 25", "2 27 2022"), or a month name anywhere
+# ("August 5th 2022"). The month must start a word and its suffix is bounded
+# ("sep" + "tember" is the longest), so filenames without a month are rejected
+# without backtracking.
+_PAT_DATE = re.compile(
+    r'^(?:\w+\s+)?(\d{1,2})\s+(\d{1,2})\s+(\d{2,4})'
+    fr'|(?<![a-z])({"|".join(_MONTH_MAP)})[a-z]{{0,6}}\s+(\d{{1,2}})(?:st|nd|rd|th)?,?\s+(\d{{4}})',
+    re.IGNORECASE
+)
 
 def extract_date_from_filename(filename):
     """
@@ -26,44 +43,32 @@ def extract_date_from_filename(filename):
     Returns date string or None if no valid date found.
     """
     # Remove file extension and the long hash at the end
-    name = re.sub(r'\s[a-f0-9]{32}$', '', os.path.splitext(filename)[0]).strip()
+    stem = filename[:-3] if filename.endswith('.md') else os.path.splitext(filename)[0]
+    name = _HASH_SUFFIX.sub('', stem).strip()
+    
+    # Already ISO-dated, e.g. "2024-01-15 Title"
+    if (len(name) >= 10 and name[4] == '-' and name[7] == '-'
+            and name[:4].isdigit() and name[5:7].isdigit() and name[8:10].isdigit()):
+        return name[:10], name[10:].strip().lstrip('-').strip()
     
-    # Try to extract title by removing the date part
-    title = name
+    match = _PAT_DATE.search(name)
+    if not match:
+        return None, name # Return original name as title if no date found
 
-    # Pattern 1: Starts with DayOfWeek, e.g., "Friday 1 10 25"
-    match = re.match(r'^(?:\w+)\s+(\d{1,2})\s+(\d{1,2})\s+(\d{2,4})', name)
-    if match:
-        month, day, year = match.groups()
+    month, day, year, month_name, name_day, name_year = match.groups()
+    if month is not None:
+        # Numeric date at the start, e.g. "Friday 1 10 25" or "2 27 2022"
         if len(year) == 2: year = '20' + year
         date_str = f"{year}-{int(month):02d}-{int(day):02d}"
         # Extract title by removing the matched part
         title = name[match.end():].strip().lstrip('-').strip()
         return date_str, title
 
-    # Pattern 2: Starts with numbers, e.g., "2 27 2022"
-    match = re.match(r'^(\d{1,2})\s+(\d{1,2})\s+(\d{2,4})', name)
-    if match:
-        month, day, year = match.groups()
-        if len(year) == 2: year = '20' + year
-        date_str = f"{year}-{int(month):02d}-{int(day):02d}"
-        title = name[match.end():].strip().lstrip('-').strip()
-        return date_str, title
-
-    # Pattern 3: With month name, e.g., "August 5th 2022"
-    month_map = {'jan':1, 'feb':2, 'mar':3, 'apr':4, 'may':5, 'jun':6, 'jul':7, 'aug':8, 'sep':9, 'oct':10, 'nov':11, 'dec':12}
-    month_pattern = '|'.join(month_map.keys())
-    match = re.search(fr'(?P<month_name>{month_pattern})[a-z]*\s+(?P<day>\d{{1,2}})(?:st|nd|rd|th)?(?:,)?\s+(?P<year>\d{{4}})', name, re.IGNORECASE)
-    if match:
-        parts = match.groupdict()
-        month = month_map[parts['month_name'][:3].lower()]
-        day = parts['day']
-        year = parts['year']
-        date_str = f"{year}-{int(month):02d}-{int(day):02d}"
-        # A bit trickier to get title here, we'll just use the whole name for now
-        return date_str, name
-
-    return None, name # Return original name as title if no date found
+    # Month name, e.g. "August 5th 2022"
+    month = _MONTH_MAP[month_name.lower()]
+    date_str = f"{name_year}-{int(month):02d}-{int(name_day):02d}"
+    # A bit trickier to get title here, we'll just use the whole name for now
+    return date_str, name
 
 
 def get_entry_details(md_file):
@@ -71,27 +76,24 @@ def get_entry_details(md_file):
     Extracts date, title, and content from a markdown file.
     """
     filename = md_file.name
-    content = md_file.read_text(encoding='utf-8')
 
     # 1. Get date and title from filename
     date_str, title_from_filename = extract_date_from_filename(filename)
 
-    # 2. Extract title from content if available
-    lines = content.split('\n')
+    # 2. Extract title from content if available, streaming the file line by
+    # line instead of holding both the whole text and its split copy
     title_from_content = None
     content_lines = []
-    in_content = False
 
-    for i, line in enumerate(lines):
-        if line.startswith('# ') and title_from_content is None:
-            title_from_content = line[2:].strip()
-            # If the next line is blank, skip it
-            if i + 1 < len(lines) and not lines[i+1].strip():
+    with open(md_file, encoding='utf-8') as f:
+        for line in f:
+            line = line.rstrip('\n')
+            if line.startswith('# ') and title_from_content is None:
+                title_from_content = line[2:].strip()
+            elif line.startswith('Created:') or line.startswith('Updated:'):
                 continue
-        elif line.startswith('Created:') or line.startswith('Updated:'):
-            continue
-        else:
-            content_lines.append(line)
+            else:
+                content_lines.append(line)
 
     final_title = title_from_content or title_from_filename or "Untitled Entry"
     final_content = '\n'.join(content_lines).strip()
@@ -99,10 +101,24 @@ def get_entry_details(md_file):
     return date_str, final_title, final_content
 
 
+def _read_entry(md_file):
+    """
+    Run get_entry_details on one file, returning any error instead of raising
+    so a single bad file doesn't stop the other reads.
+    """
+    try:
+        return get_entry_details(md_file), None
+    except Exception as e:
+        return None, e
+
+
 def convert_journal_files(journal_dir='data/journal_1', output_file='data/journal_entries.csv'):
     """
     Convert all Markdown journal files to CSV format
     """
+    # Imported here so the date validator can reuse the filename parser cheaply
+    import pandas as pd
+    
     journal_path = Path(journal_dir)
     
     if not journal_path.exists():
@@ -111,17 +127,28 @@ def convert_journal_files(journal_dir='data/journal_1', output_file='data/journa
     
     entries = []
     
-    # Get all .md files
-    md_files = list(journal_path.glob('*.md'))
+    # Get all .md files in one directory pass (scandir reuses the directory's file types)
+    with os.scandir(journal_path) as it:
+        md_files = [
+            Path(entry.path) for entry in it
+            if entry.name.endswith('.md') and entry.is_file()
+        ]
     print(f"📁 Found {len(md_files)} journal entries")
     
     processed_files = 0
     skipped_files = 0
     
-    for md_file in md_files:
-        try:
-            date_str, title, content = get_entry_details(md_file)
+    # Read files concurrently; map keeps results in directory order
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+        results = executor.map(_read_entry, md_files)
+        
+        for md_file, (details, error) in zip(md_files, results):
+            if error is not None:
+                print(f"❌ Error processing '{md_file.name}': {error}")
+                skipped_files += 1
+                continue
             
+            date_str, title, content = details
             if date_str:
                 entries.append({
                     'date': date_str,
@@ -132,10 +159,6 @@ def convert_journal_files(journal_dir='data/journal_1', output_file='data/journa
             else:
                 print(f"⚠️  Skipping '{md_file.name}': Could not determine a valid date.")
                 skipped_files += 1
-
-        except Exception as e:
-            print(f"❌ Error processing '{md_file.name}': {e}")
-            skipped_files += 1
             
     if not entries:
         print("❌ No entries were successfully processed.")
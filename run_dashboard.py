@@ -8,19 +8,25 @@ It includes error checking and helpful messages for common issues.
 
 import sys
 import os
-import subprocess
+import argparse
 import importlib.util
 
-def check_dependencies():
-    """Check if all required packages are installed."""
-    required_packages = [
-        'streamlit',
-        'textblob', 
-        'pandas',
-        'plotly',
-        'matplotlib',
-        'wordcloud'
-    ]
+def check_dependencies(full=False):
+    """
+    Check if the required packages are installed.
+    
+    By default only Streamlit is checked, since the launcher can't start
+    without it; pass full=True (--check-deps) to check every package.
+    """
+    required_packages = ['streamlit']
+    if full:
+        required_packages += [
+            'textblob', 
+            'pandas',
+            'plotly',
+            'matplotlib',
+            'wordcloud'
+        ]
     
     missing_packages = []
     
@@ -52,13 +58,21 @@ def check_data_file():
     print("✅ Sample data file found!")
     return True
 
-def main():
+def main(argv=None):
     """Main function to launch the dashboard."""
+    parser = argparse.ArgumentParser(description="Launch the Mood Tracker Dashboard.")
+    parser.add_argument(
+        "--check-deps",
+        action="store_true",
+        help="Check that every required package is installed, not just Streamlit."
+    )
+    args = parser.parse_args(argv)
+    
     print("🧠 Mood Tracker Dashboard Launcher")
     print("=" * 40)
     
     # Check dependencies
-    if not check_dependencies():
+    if not check_dependencies(full=args.check_deps):
         return
     
     # Check data file
@@ -70,17 +84,18 @@ def main():
     print("   Press Ctrl+C to stop the server.")
     print()
     
+    # Flush before exec, which replaces this process without running cleanup
+    sys.stdout.flush()
+    
     try:
-        # Launch Streamlit dashboard
-        subprocess.run([
+        # Replace the launcher with Streamlit instead of waiting on a child process
+        os.execv(sys.executable, [
             sys.executable, '-m', 'streamlit', 'run', 
             'app/dashboard.py',
             '--server.port', '8501',
             '--server.address', 'localhost'
         ])
-    except KeyboardInterrupt:
-        print("\n👋 Dashboard stopped.")
-    except Exception as e:
+    except OSError as e:
         print(f"\n❌ Error launching dashboard: {e}")
         print("\n💡 Try running manually:")
         print("   streamlit run app/dashboard.py")
@@ -8,10 +8,14 @@ This script:
 3. Ensures everything is set up correctly
 """
 
-import subprocess
-import sys
 import os
 
+from convert_journal import convert_journal_files
+import run_dashboard
+
+# CSV the converter writes and the dashboard picks up
+JOURNAL_CSV = 'data/journal_entries.csv'
+
 def main():
     """
     Main function to set up and run the dashboard
@@ -22,15 +26,14 @@ def main():
     # Step 1: Convert journal files
     print("\n🔄 Step 1: Converting your journal files...")
     try:
-        result = subprocess.run([sys.executable, 'convert_journal.py'], 
-                              capture_output=True, text=True)
-        
-        if result.returncode == 0:
+        # Run the conversion in this process; its progress prints as it goes
+        if convert_journal_files(output_file=JOURNAL_CSV):
             print("✅ Journal conversion completed successfully!")
-            print(result.stdout)
+        elif os.path.exists(JOURNAL_CSV):
+            # Nothing new to convert, but earlier converted entries can still be shown
+            print(f"⚠️ No journal entries converted; using the existing {JOURNAL_CSV}")
         else:
-            print("❌ Journal conversion failed:")
-            print(result.stderr)
+            print("❌ Journal conversion failed.")
             return
             
     except Exception as e:
@@ -43,12 +46,8 @@ def main():
     print("Press Ctrl+C to stop the server.")
     print()
     
-    try:
-        subprocess.run([sys.executable, 'run_dashboard.py'])
-    except KeyboardInterrupt:
-        print("\n👋 Dashboard stopped.")
-    except Exception as e:
-        print(f"\n❌ Error launching dashboard: {e}")
+    # The launcher replaces this process with Streamlit
+    run_dashboard.main([])
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
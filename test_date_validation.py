@@ -5,86 +5,123 @@ This helps catch problematic dates before they cause conversion errors.
 """
 
 import os
-import re
-from pathlib import Path
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 
+import convert_journal
+
+# Journals with more files than this are validated across a process pool
+PARALLEL_THRESHOLD = 10_000
+
+# Reasonable years for a journal entry: within 1900-2100, at most 50 years
+# back and 10 years ahead. Looked up once rather than on every date
+_CURRENT_YEAR = datetime.now().year
+_MIN_YEAR = max(1900, _CURRENT_YEAR - 50)
+_MAX_YEAR = min(2100, _CURRENT_YEAR + 10)
+# Days per month, with February as in a leap year
+_DAYS_IN_MONTH = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+@lru_cache(maxsize=4096)
 def extract_date_from_filename(filename):
     """
-    Extract date from filename using various patterns.
+    Extract date from filename the same way convert_journal.py does.
     Returns date string or None if no valid date found.
+    Results are cached, so repeated runs over the same journal skip the parsing.
     """
-    # Remove file extension and the long hash at the end
-    name = re.sub(r'\s[a-f0-9]{32}$', '', os.path.splitext(filename)[0]).strip()
-    
-    # Pattern 1: Starts with DayOfWeek, e.g., "Friday 1 10 25"
-    # Catches "Friday 1 10 25", "Monday 3 31 25"
-    match = re.match(r'^(?:\w+)\s+(\d{1,2})\s+(\d{1,2})\s+(\d{2,4})', name)
-    if match:
-        month, day, year = match.groups()
-        if len(year) == 2: year = '20' + year
-        return f"{year}-{int(month):02d}-{int(day):02d}"
-
-    # Pattern 2: Starts with numbers, e.g., "2 27 2022 Job Grateful List"
-    match = re.match(r'^(\d{1,2})\s+(\d{1,2})\s+(\d{2,4})', name)
-    if match:
-        month, day, year = match.groups()
-        if len(year) == 2: year = '20' + year
-        return f"{year}-{int(month):02d}-{int(day):02d}"
-
-    # Pattern 3: With month name, e.g., "Colonoscopy Friday August 5th 2022"
-    month_map = {'jan':1, 'feb':2, 'mar':3, 'apr':4, 'may':5, 'jun':6, 'jul':7, 'aug':8, 'sep':9, 'oct':10, 'nov':11, 'dec':12}
-    month_pattern = '|'.join(month_map.keys())
-    # This regex is more flexible and looks for the pattern anywhere in the string
-    match = re.search(fr'(?P<month_name>{month_pattern})[a-z]*\s+(?P<day>\d{{1,2}})(?:st|nd|rd|th)?(?:,)?\s+(?P<year>\d{{4}})', name, re.IGNORECASE)
-    if match:
-        parts = match.groupdict()
-        month = month_map[parts['month_name'][:3].lower()]
-        day = parts['day']
-        year = parts['year']
-        return f"{year}-{int(month):02d}-{int(day):02d}"
-
-    return None
+    # Share the converter's parser so the validator predicts exactly what it will do
+    return convert_journal.extract_date_from_filename(filename)[0]
+
+
+def _days_in_month(year, month):
+    """
+    Number of days in the given month, allowing for leap years.
+    """
+    if month == 2 and not (year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)):
+        return 28
+    return _DAYS_IN_MONTH[month - 1]
+
+
+# Every acceptable date, so the common case is a single set lookup
+_VALID_DATES = frozenset(
+    f"{year:04d}-{month:02d}-{day:02d}"
+    for year in range(_MIN_YEAR, _MAX_YEAR + 1)
+    for month in range(1, 13)
+    for day in range(1, _days_in_month(year, month) + 1)
+)
+
 
 def is_valid_date(date_str):
     """
     Check if a date string represents a valid, reasonable date.
     """
+    if date_str in _VALID_DATES:
+        return True, "Valid date"
+    
     try:
-        # Parse the date
-        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
+        # Parse the date. Dates from extract_date_from_filename are always
+        # YYYY-MM-DD, so slice out the fields and check them by hand
+        if (len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-'
+                and (date_str[:4] + date_str[5:7] + date_str[8:]).isdecimal()):
+            year, month, day = int(date_str[:4]), int(date_str[5:7]), int(date_str[8:])
+            if year < 1 or not 1 <= month <= 12 or not 1 <= day <= _days_in_month(year, month):
+                datetime.strptime(date_str, '%Y-%m-%d')  # raises ValueError with the usual message
+        else:
+            year = datetime.strptime(date_str, '%Y-%m-%d').year
         
-        # Check if year is reasonable (between 1900 and 2100)
-        if date_obj.year < 1900 or date_obj.year > 2100:
-            return False, f"Year {date_obj.year} is outside reasonable range (1900-2100)"
+        if _MIN_YEAR <= year <= _MAX_YEAR:
+            return True, "Valid date"
         
-        # Check if date is in the future (more than 10 years from now)
-        current_year = datetime.now().year
-        if date_obj.year > current_year + 10:
+        # Work out which bound was crossed
+        if year < 1900 or year > 2100:
+            return False, f"Year {year} is outside reasonable range (1900-2100)"
+        if year > _MAX_YEAR:
             return False, f"Date {date_str} is more than 10 years in the future"
-        
-        # Check if date is too far in the past (more than 50 years ago)
-        if date_obj.year < current_year - 50:
-            return False, f"Date {date_str} is more than 50 years in the past"
-        
-        return True, "Valid date"
+        return False, f"Date {date_str} is more than 50 years in the past"
         
     except ValueError as e:
         return False, f"Invalid date format: {str(e)}"
 
+def _validate_one(filename):
+    """
+    Validate the date in a single filename.
+    Returns (filename, date string or None, is_valid, message).
+    """
+    date_str = extract_date_from_filename(filename)
+    if not date_str:
+        return filename, None, False, 'No date found in filename'
+    is_valid, message = is_valid_date(date_str)
+    return filename, date_str, is_valid, message
+
+def _write_report(text):
+    """
+    Write a block of report text to stdout, encoding it in one go.
+    """
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        sys.stdout.write(text)
+        return
+    # Flush pending text first so the report stays in order, and translate
+    # newlines the way the text layer would
+    sys.stdout.flush()
+    if os.linesep != '\n':
+        text = text.replace('\n', os.linesep)
+    buffer.write(text.encode(sys.stdout.encoding or 'utf-8', sys.stdout.errors or 'strict'))
+    buffer.flush()
+
 def test_journal_dates():
     """
     Test all journal files for date validation issues.
     """
-    journal_dir = Path("data/journal_1")
-    
-    if not journal_dir.exists():
+    # Get all markdown file names
+    try:
+        with os.scandir("data/journal_1") as entries:
+            md_files = [entry.name for entry in entries if entry.name.endswith(".md")]
+    except FileNotFoundError:
         print("❌ Journal directory not found")
         return False
     
-    # Get all markdown files
-    md_files = list(journal_dir.glob("*.md"))
-    
     if not md_files:
         print("❌ No markdown files found")
         return False
@@ -92,45 +129,37 @@ def test_journal_dates():
     print(f"🔍 Testing {len(md_files)} journal files for date validation...")
     print("=" * 60)
     
-    issues_found = []
+    # Problem files as parallel lists of name, severity icon and message
+    bad_files, bad_icons, bad_msgs = [], [], []
     valid_files = 0
     
-    for md_file in md_files:
-        # Extract date from filename
-        date_str = extract_date_from_filename(md_file.name)
-        
-        if not date_str:
-            issues_found.append({
-                'file': md_file.name,
-                'issue': 'No date found in filename',
-                'severity': 'warning'
-            })
-            continue
-        
-        # Validate the date
-        is_valid, message = is_valid_date(date_str)
-        
+    # Parsing is pure Python, so very large journals are spread over processes
+    if len(md_files) > PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(_validate_one, md_files, chunksize=256))
+    else:
+        results = map(_validate_one, md_files)
+    
+    for md_file, date_str, is_valid, message in results:
         if is_valid:
             valid_files += 1
         else:
-            issues_found.append({
-                'file': md_file.name,
-                'date': date_str,
-                'issue': message,
-                'severity': 'error'
-            })
+            bad_files.append(md_file)
+            bad_icons.append("❌" if date_str else "⚠️")
+            bad_msgs.append(message)
     
     # Summary
     print("\n" + "=" * 60)
     print(f"📊 Test Results:")
     print(f"   ✅ Valid files: {valid_files}")
-    print(f"   ❌ Issues found: {len(issues_found)}")
+    print(f"   ❌ Issues found: {len(bad_files)}")
     
-    if issues_found:
+    if bad_files:
         print(f"\n🚨 Issues that need attention:")
-        for issue in issues_found:
-            severity_icon = "❌" if issue['severity'] == 'error' else "⚠️"
-            print(f"   {severity_icon} {issue['file']}: {issue['issue']}")
+        # Write the whole list at once rather than one print per issue
+        lines = [f"   {severity_icon} {md_file}: {message}"
+                 for md_file, severity_icon, message in zip(bad_files, bad_icons, bad_msgs)]
+        _write_report("\n".join(lines) + "\n")
         
         print(f"\n💡 Recommendations:")
         print(f"   - For files with 'No date found', consider renaming them to a standard format like 'YYYY-MM-DD Title.md' or 'Month Day Year Title.md'")